@@ -14,6 +14,8 @@ sys.path.append(str(Path(__file__).parent))
 
 from src.resume_parser import ResumeParser
 from src.resume_matcher import ResumeMatcher
+from src.archive_ingest import ArchiveIngestor
+from src.retention import RetentionManager
 
 # Set page config
 st.set_page_config(
@@ -73,9 +75,18 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_retention_manager() -> RetentionManager:
+    """Create the retention manager once per server and start its background sweep."""
+    manager = RetentionManager()
+    manager.start_background_sweep()
+    return manager
+
 class ResumeScreeningApp:
     def __init__(self):
         self.resume_matcher = ResumeMatcher()
+        self.archive_ingestor = ArchiveIngestor()
+        self.retention = get_retention_manager()
         self.uploaded_resumes = []
         self.job_description = ""
         self.results = []
@@ -89,13 +100,41 @@ class ResumeScreeningApp:
         file_path = self.UPLOAD_DIR / uploaded_file.name
         with open(file_path, "wb") as f:
             f.write(uploaded_file.getbuffer())
+        # Retention is bookkeeping only; never fail an upload because of it
+        try:
+            self.retention.track(str(file_path), category='upload')
+        except Exception as e:
+            print(f"Error tracking {file_path} for retention: {str(e)}")
         return str(file_path)
     
+    def process_archive(self, archive_file) -> List[Dict[str, Any]]:
+        """Parse every resume inside an uploaded ZIP archive without saving it."""
+        try:
+            ingest_result = self.archive_ingestor.ingest(archive_file)
+        except Exception as e:
+            st.error(f"Error processing {archive_file.name}: {str(e)}")
+            return []
+        
+        for error in ingest_result['errors']:
+            st.error(f"Error processing {archive_file.name}/{error['file_name']}: {error['error']}")
+        
+        stats = ingest_result['stats']
+        st.info(
+            f"{archive_file.name}: parsed {stats['files']} resumes in "
+            f"{stats['seconds']:.1f}s ({stats['files_per_sec']:.1f} files/sec)"
+        )
+        return ingest_result['resumes']
+    
     def process_resumes(self, resume_files) -> List[Dict[str, Any]]:
         """Process multiple resume files and return parsed data."""
         results = []
         
         for file in resume_files:
+            # ZIP archives are streamed member by member instead of saved
+            if file.name.lower().endswith('.zip'):
+                results.extend(self.process_archive(file))
+                continue
+            
             try:
                 # Save the uploaded file
                 file_path = self.save_uploaded_file(file)
@@ -256,8 +295,8 @@ class ResumeScreeningApp:
             st.markdown("---")
             st.header("Upload Resumes")
             uploaded_files = st.file_uploader(
-                "Upload resume files (PDF/DOCX):",
-                type=["pdf", "docx"],
+                "Upload resume files (PDF/DOCX) or ZIP archives of them:",
+                type=["pdf", "docx", "zip"],
                 accept_multiple_files=True
             )
             
@@ -317,7 +356,7 @@ class ResumeScreeningApp:
         st.info("""
             ### How to use this tool:
             1. **Enter a job description** in the sidebar
-            2. **Upload resume files** (PDF or DOCX)
+            2. **Upload resume files** (PDF or DOCX, or a ZIP archive of them)
             3. Click **"Analyze Resumes"** to start the analysis
             
             The system will analyze each resume and provide:
@@ -73,4 +73,4 @@ def clean_project():
         print(f"  - {d}/")
 
 if __name__ == "__main__":
-    clean_profile()
+    clean_project()
@@ -0,0 +1,118 @@
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+SKILLS = [
+    'python', 'java', 'sql', 'docker', 'kubernetes', 'aws', 'machine learning',
+    'data analysis', 'rest api', 'react', 'leadership', 'communication', 'git',
+    'linux', 'tensorflow', 'pandas', 'agile', 'testing', 'cloud', 'spark'
+]
+
+
+def make_text(rng: random.Random, n_skills: int) -> str:
+    """Build a synthetic resume or job description from random skills."""
+    skills = rng.sample(SKILLS, n_skills)
+    return f"Experienced engineer with skills in {', '.join(skills)}. " * 3
+
+
+def percentile(values, pct: float) -> float:
+    """Return the pct-th percentile of the values (nearest-rank)."""
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def post_json(url: str, payload: dict, timeout: float) -> int:
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode('utf-8'),
+        headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def run_load_test(base_url: str, endpoint: str, total_requests: int, concurrency: int,
+                  job_descriptions: int, resumes_per_rank: int, timeout: float, seed: int):
+    rng = random.Random(seed)
+    jobs = [make_text(rng, 8) for _ in range(job_descriptions)]
+    resumes = [make_text(rng, rng.randint(4, 12)) for _ in range(200)]
+
+    payloads = []
+    for _ in range(total_requests):
+        job = rng.choice(jobs)
+        if endpoint == 'rank':
+            payloads.append({
+                'job_description': job,
+                'resumes': [{'file_name': f"resume_{i}.pdf", 'text': rng.choice(resumes)}
+                            for i in range(resumes_per_rank)]
+            })
+        else:
+            payloads.append({'resume_text': rng.choice(resumes), 'job_description': job})
+
+    url = f"{base_url.rstrip('/')}/{endpoint}"
+    latencies = []
+    failures = 0
+    lock = threading.Lock()
+
+    def send(payload):
+        nonlocal failures
+        start = time.perf_counter()
+        try:
+            status = post_json(url, payload, timeout)
+        except Exception:
+            status = None
+        elapsed = time.perf_counter() - start
+        with lock:
+            # Only successful requests count towards latency and throughput
+            if status == 200:
+                latencies.append(elapsed)
+            else:
+                failures += 1
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send, payloads))
+    wall_time = time.perf_counter() - start_time
+
+    print(f"Endpoint:     POST {url}")
+    print(f"Requests:     {total_requests}, concurrency {concurrency}")
+    print(f"Succeeded:    {len(latencies)}")
+    print(f"Failed:       {failures} ({failures / wall_time:.1f} failures/sec)")
+    print(f"Wall time:    {wall_time:.2f}s")
+    print(f"Throughput:   {len(latencies) / wall_time:.1f} successful requests/sec")
+    if latencies:
+        print(f"Latency p50:  {percentile(latencies, 50) * 1000:.1f} ms")
+        print(f"Latency p99:  {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local resume scoring service.")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="Service base URL (default: %(default)s)")
+    parser.add_argument('--endpoint', choices=['match', 'rank'], default='match',
+                        help="Endpoint to exercise (default: %(default)s)")
+    parser.add_argument('--requests', type=int, default=1000, help="Total requests to send (default: %(default)s)")
+    parser.add_argument('--concurrency', type=int, default=32, help="Concurrent clients (default: %(default)s)")
+    parser.add_argument('--job-descriptions', type=int, default=3,
+                        help="Distinct job descriptions to spread requests over (default: %(default)s)")
+    parser.add_argument('--resumes-per-rank', type=int, default=20,
+                        help="Resumes per /rank request (default: %(default)s)")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for synthetic data")
+    args = parser.parse_args()
+
+    run_load_test(args.url, args.endpoint, args.requests, args.concurrency,
+                  args.job_descriptions, args.resumes_per_rank, args.timeout, args.seed)
+
+
+if __name__ == "__main__":
+    main()
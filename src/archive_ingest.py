@@ -0,0 +1,172 @@
+import io
+import lzma
+import os
+import time
+import zipfile
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.resume_parser import ResumeParser, detect_file_type
+
+# Default limits, chosen to comfortably fit real resumes while keeping a
+# malicious archive (zip bomb) from exhausting memory.
+DEFAULT_MAX_MEMBER_SIZE = 20 * 1024 * 1024       # 20 MB per resume
+DEFAULT_MAX_TOTAL_SIZE = 1024 * 1024 * 1024      # 1 GB decompressed per archive
+DEFAULT_MAX_MEMBERS = 10000
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveIngestor:
+    """Stream resumes out of a ZIP archive and parse them without touching disk."""
+
+    def __init__(self,
+                 max_member_size: int = DEFAULT_MAX_MEMBER_SIZE,
+                 max_total_size: int = DEFAULT_MAX_TOTAL_SIZE,
+                 max_members: int = DEFAULT_MAX_MEMBERS):
+        """Initialize the ingestor with its safety limits.
+
+        Args:
+            max_member_size: Maximum decompressed size of a single member in bytes
+            max_total_size: Maximum decompressed size of the whole archive in bytes
+            max_members: Maximum number of file members to read from the archive
+        """
+        self.max_member_size = max_member_size
+        self.max_total_size = max_total_size
+        self.max_members = max_members
+
+    def _read_member(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo, limit: int) -> Optional[bytes]:
+        """Decompress a member in chunks, giving up as soon as ``limit`` is crossed.
+
+        The sizes recorded in the archive header are not trusted; the limit is
+        enforced on the bytes actually produced by the decompressor.
+
+        Returns:
+            The member contents, or None if it is larger than ``limit``
+            
+        Raises:
+            zipfile.BadZipFile, RuntimeError, NotImplementedError, etc. if the
+            member is corrupt, encrypted or uses an unsupported compression
+        """
+        buffer = io.BytesIO()
+        with archive.open(info) as member:
+            while True:
+                chunk = member.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer.write(chunk)
+                if buffer.tell() > limit:
+                    return None
+        return buffer.getvalue()
+
+    def iter_members(self, source: Union[str, BinaryIO]) -> Iterator[Tuple[str, Optional[io.BytesIO], Optional[str], Optional[str]]]:
+        """Yield ``(name, stream, file_type, error)`` for each resume-like member of the archive.
+
+        Members are sniffed by their magic bytes; anything that is not a PDF or
+        Word document is skipped. ZIP-based members (xlsx, pptx, nested zips)
+        share the DOCX signature, so they are only kept when named ``.docx``.
+        Legacy OLE2 members (doc, xls, ppt, msg) cannot be parsed from memory:
+        ``.doc`` files are reported as unsupported and the rest are skipped.
+        Members that are too large, corrupt, encrypted or otherwise unreadable
+        are reported with an error and no stream. Exceeding the total size or
+        member count limit reports an error and stops the iteration, keeping
+        everything yielded so far.
+
+        Args:
+            source: Path to the ZIP file or a seekable binary stream
+        """
+        total_size = 0
+        member_count = 0
+
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                name = info.filename
+                base_name = os.path.basename(name)
+                # Skip macOS resource forks and hidden files
+                if name.startswith('__MACOSX/') or base_name.startswith('.'):
+                    continue
+
+                member_count += 1
+                if member_count > self.max_members:
+                    yield name, None, None, f"Archive exceeds member limit of {self.max_members} files"
+                    return
+
+                # Cheap early rejection based on the declared size
+                if info.file_size > self.max_member_size:
+                    yield name, None, None, f"{name} exceeds per-file size limit of {self.max_member_size} bytes"
+                    continue
+
+                limit = min(self.max_member_size, self.max_total_size - total_size)
+                try:
+                    data = self._read_member(archive, info, limit)
+                except (zipfile.BadZipFile, zlib.error, lzma.LZMAError, OSError, EOFError,
+                        RuntimeError, NotImplementedError) as e:
+                    yield name, None, None, f"Error reading {name}: {str(e)}"
+                    continue
+                if data is None:
+                    if limit < self.max_member_size:
+                        yield name, None, None, f"Archive exceeds total size limit of {self.max_total_size} bytes"
+                        return
+                    yield name, None, None, f"{name} exceeds per-file size limit of {self.max_member_size} bytes"
+                    continue
+                total_size += len(data)
+
+                file_type = detect_file_type(data[:4])
+                if not file_type:
+                    continue
+                if data[:4] == b'PK\x03\x04' and not base_name.lower().endswith('.docx'):
+                    continue
+                if data[:4] == b'\xD0\xCF\x11\xE0':
+                    if base_name.lower().endswith('.doc'):
+                        yield name, None, None, (f"{name} is a legacy .doc file, which is not supported "
+                                                 f"inside archives; convert it to DOCX or PDF")
+                    continue
+
+                yield name, io.BytesIO(data), file_type, None
+
+    def ingest(self, source: Union[str, BinaryIO]) -> Dict[str, Any]:
+        """Parse every resume in the archive.
+
+        Args:
+            source: Path to the ZIP file or a seekable binary stream
+
+        Returns:
+            Dictionary with the parsed ``resumes``, per-member ``errors`` and
+            throughput ``stats`` (files, bytes, seconds, files_per_sec)
+        """
+        resumes: List[Dict[str, Any]] = []
+        errors: List[Dict[str, str]] = []
+        total_bytes = 0
+        start_time = time.perf_counter()
+
+        for name, stream, file_type, error in self.iter_members(source):
+            if error:
+                errors.append({'file_name': name, 'error': error})
+                continue
+
+            size = len(stream.getbuffer())
+            try:
+                parser = ResumeParser(name, stream=stream, file_type=file_type)
+                resume_data = parser.parse()
+            except Exception as e:
+                errors.append({'file_name': name, 'error': str(e)})
+                continue
+
+            resume_data['file_name'] = name
+            resume_data['file_size'] = f"{size / 1024:.1f} KB"
+            resumes.append(resume_data)
+            total_bytes += size
+
+        elapsed = time.perf_counter() - start_time
+        return {
+            'resumes': resumes,
+            'errors': errors,
+            'stats': {
+                'files': len(resumes),
+                'bytes': total_bytes,
+                'seconds': elapsed,
+                'files_per_sec': len(resumes) / elapsed if elapsed > 0 else 0.0
+            }
+        }
@@ -5,7 +5,7 @@ import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import string
 from typing import List, Dict, Tuple, Any
@@ -85,7 +85,15 @@ class ResumeMatcher:
             # Preprocess both texts
             text1_processed = self.preprocess_text(text1)
             text2_processed = self.preprocess_text(text2)
-            
+        except Exception as e:
+            print(f"Error calculating similarity: {str(e)}")
+            return 0.0
+
+        return self._pairwise_similarity(text1_processed, text2_processed)
+    
+    def _pairwise_similarity(self, text1_processed: str, text2_processed: str) -> float:
+        """Fit TF-IDF on two preprocessed texts and return their cosine similarity."""
+        try:
             # Create TF-IDF vectors
             tfidf_matrix = self.vectorizer.fit_transform([text1_processed, text2_processed])
             
@@ -98,41 +106,117 @@ class ResumeMatcher:
             print(f"Error calculating similarity: {str(e)}")
             return 0.0
     
-    def match_resume_to_job(self, resume_text: str, job_description: str) -> Dict[str, Any]:
-        """Match a resume to a job description and return a score and analysis."""
+    def calculate_similarities(self, texts: List[str], reference_text: str) -> np.ndarray:
+        """Calculate the cosine similarity of each text against a reference text.
+        
+        Vectorized equivalent of calling ``calculate_similarity(text, reference_text)``
+        for every text: the scores are identical, but term counting and scoring
+        happen in a single pass over all texts.
+        """
+        return self._similarities_from_processed(
+            [self.preprocess_text(text) for text in texts],
+            self.preprocess_text(reference_text)
+        )
+    
+    def _similarities_from_processed(self, processed: List[str], reference_processed: str) -> np.ndarray:
+        """Score already preprocessed texts against a preprocessed reference text."""
+        if not processed:
+            return np.zeros(0)
+        
+        # The closed form below relies on these TfidfVectorizer settings; fall
+        # back to fitting each pair if they are ever changed.
+        params = self.vectorizer.get_params()
+        closed_form_applies = (
+            (params['use_idf'], params['smooth_idf'], params['sublinear_tf'], params['norm']) == (True, True, False, 'l2')
+            # Corpus-dependent vocabulary settings would differ between a batch fit and a pairwise fit
+            and params['max_features'] is None
+            and params['min_df'] == 1
+            and params['max_df'] == 1.0
+            and params['vocabulary'] is None
+        )
+        if not closed_form_applies:
+            return np.array([self._pairwise_similarity(text, reference_processed) for text in processed])
+        
+        try:
+            # Count terms over a shared vocabulary, tokenized exactly as self.vectorizer does
+            count_params = CountVectorizer().get_params().keys()
+            counter = CountVectorizer(**{key: value for key, value in params.items()
+                                         if key in count_params and key != 'dtype'})
+            counts = counter.fit_transform(processed + [reference_processed]).astype(np.float64)
+            resume_counts = counts[:-1]
+            ref_counts = counts[-1].toarray().ravel()
+        except ValueError:
+            # Empty vocabulary, as raised by fitting on the texts pairwise
+            return np.zeros(len(processed))
+        
+        # A pairwise TF-IDF fit over two documents gives a shared term idf 1 and
+        # a term present in only one of them idf 1 + ln(3/2) (smoothed idf), so
+        # the pairwise scores can be computed from raw counts directly.
+        only_one_idf_sq = (1 + np.log(1.5)) ** 2
+        in_ref = (ref_counts > 0).astype(np.float64)
+        in_resume = resume_counts.copy()
+        in_resume.data[:] = 1.0
+        
+        dot = resume_counts @ ref_counts
+        resume_sq = resume_counts.multiply(resume_counts)
+        resume_norm_sq = (only_one_idf_sq * np.asarray(resume_sq.sum(axis=1)).ravel()
+                          - (only_one_idf_sq - 1) * (resume_sq @ in_ref))
+        ref_sq = ref_counts ** 2
+        ref_norm_sq = (only_one_idf_sq * ref_sq.sum()
+                       - (only_one_idf_sq - 1) * (in_resume @ ref_sq))
+        
+        norms = np.sqrt(resume_norm_sq * ref_norm_sq)
+        return np.divide(dot, norms, out=np.zeros(len(processed)), where=norms > 0)
+    
+    def match_resumes_to_job(self, resume_texts: List[str], job_description: str) -> List[Dict[str, Any]]:
+        """Match several resumes to one job description in a single vectorized call.
+        
+        Returns one result per resume, in input order, in the same format as
+        ``match_resume_to_job``.
+        """
         try:
-            # Calculate similarity score
-            similarity_score = self.calculate_similarity(resume_text, job_description)
+            # Calculate similarity scores
+            processed = [self.preprocess_text(text) for text in resume_texts]
+            similarity_scores = self._similarities_from_processed(
+                processed, self.preprocess_text(job_description)
+            )
             
-            # Extract keywords from job description
+            # Extract keywords from job description; they only depend on it, so do it once
             job_keywords = self.extract_keywords(job_description)
             
-            # Check for presence of job keywords in resume
-            resume_tokens = set(self.preprocess_text(resume_text).split())
-            matched_keywords = [kw for kw in job_keywords if kw in resume_tokens]
-            
-            # Calculate keyword coverage
-            keyword_coverage = len(matched_keywords) / len(job_keywords) if job_keywords else 0
-            
-            # Calculate final score (weighted average of similarity and keyword coverage)
-            final_score = (0.6 * similarity_score) + (0.4 * keyword_coverage)
-            final_score = min(max(final_score, 0), 1)  # Ensure score is between 0 and 1
-            
-            return {
-                'score': final_score * 100,  # Convert to percentage
-                'similarity_score': similarity_score * 100,
-                'keyword_coverage': keyword_coverage * 100,
-                'matched_keywords': matched_keywords,
-                'total_keywords': len(job_keywords)
-            }
+            results = []
+            for resume_processed, similarity_score in zip(processed, similarity_scores):
+                # Check for presence of job keywords in resume
+                resume_tokens = set(resume_processed.split())
+                matched_keywords = [kw for kw in job_keywords if kw in resume_tokens]
+                
+                # Calculate keyword coverage
+                keyword_coverage = len(matched_keywords) / len(job_keywords) if job_keywords else 0
+                
+                # Calculate final score (weighted average of similarity and keyword coverage)
+                final_score = (0.6 * similarity_score) + (0.4 * keyword_coverage)
+                final_score = min(max(final_score, 0), 1)  # Ensure score is between 0 and 1
+                
+                results.append({
+                    'score': float(final_score) * 100,  # Convert to percentage
+                    'similarity_score': float(similarity_score) * 100,
+                    'keyword_coverage': keyword_coverage * 100,
+                    'matched_keywords': matched_keywords,
+                    'total_keywords': len(job_keywords)
+                })
+            return results
             
         except Exception as e:
             print(f"Error in resume-job matching: {str(e)}")
-            return {
+            return [{
                 'score': 0.0,
                 'similarity_score': 0.0,
                 'keyword_coverage': 0.0,
                 'matched_keywords': [],
                 'total_keywords': 0,
                 'error': str(e)
-            }
+            } for _ in resume_texts]
+    
+    def match_resume_to_job(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+        """Match a resume to a job description and return a score and analysis."""
+        return self.match_resumes_to_job([resume_text], job_description)[0]
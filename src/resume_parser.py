@@ -2,19 +2,50 @@ import re
 import os
 import PyPDF2
 from docx import Document
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO
+
+
+def detect_file_type(header: bytes) -> Optional[str]:
+    """Determine the file type from the leading magic bytes of a file.
+    
+    Args:
+        header: At least the first 4 bytes of the file
+        
+    Returns:
+        'pdf' or 'docx', or None if the signature is not recognised
+    """
+    if header[:4] == b'%PDF':
+        return 'pdf'
+    elif header[:4] in [b'PK\x03\x04', b'\xD0\xCF\x11\xE0']:  # DOCX or DOC
+        return 'docx'
+    return None
+
 
 class ResumeParser:
     """Parse resume files (PDF/DOCX) and extract text content."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, stream: Optional[BinaryIO] = None,
+                 file_type: Optional[str] = None):
         """Initialize with the path to the resume file.
         
         Args:
-            file_path: Path to the resume file (PDF or DOCX)
+            file_path: Path to the resume file (PDF or DOCX). When a stream
+                is given this is only used as the display name.
+            stream: Optional seekable binary stream holding the file contents,
+                used instead of reading ``file_path`` from disk
+            file_type: Optional known file type ('pdf' or 'docx'), e.g. from
+                ``detect_file_type``; skips detection by extension
         """
         self.file_path = file_path
-        self.file_type = self._get_file_type()
+        self.stream = stream
+        self.file_type = file_type or self._get_file_type()
+        
+    def _open(self) -> BinaryIO:
+        """Return a binary handle on the resume contents, rewound to the start."""
+        if self.stream is not None:
+            self.stream.seek(0)
+            return self.stream
+        return open(self.file_path, 'rb')
         
     def _get_file_type(self) -> str:
         """Determine the file type using file extension and magic numbers."""
@@ -28,12 +59,14 @@ class ResumeParser:
         else:
             # Fallback to checking file signature
             try:
-                with open(self.file_path, 'rb') as f:
-                    header = f.read(4)
-                    if header == b'%PDF':
-                        return 'pdf'
-                    elif header in [b'PK\x03\x04', b'\xD0\xCF\x11\xE0']:  # DOCX or DOC
-                        return 'docx'
+                f = self._open()
+                try:
+                    file_type = detect_file_type(f.read(4))
+                finally:
+                    if f is not self.stream:
+                        f.close()
+                if file_type:
+                    return file_type
             except:
                 pass
                 
@@ -52,10 +85,14 @@ class ResumeParser:
         """Extract text from a PDF file."""
         text = ""
         try:
-            with open(self.file_path, 'rb') as file:
+            file = self._open()
+            try:
                 reader = PyPDF2.PdfReader(file)
                 for page in reader.pages:
                     text += page.extract_text() + "\n"
+            finally:
+                if file is not self.stream:
+                    file.close()
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
         return text
@@ -63,11 +100,11 @@ class ResumeParser:
     def _extract_from_docx(self) -> str:
         """Extract text from a DOCX file."""
         try:
-            doc = Document(self.file_path)
+            doc = Document(self._open() if self.stream is not None else self.file_path)
             return "\n".join([paragraph.text for paragraph in doc.paragraphs])
         except Exception as e:
-            # If it's a .doc file, try using textract if available
-            if self.file_path.lower().endswith('.doc'):
+            # If it's a .doc file on disk, try using textract if available
+            if self.stream is None and self.file_path.lower().endswith('.doc'):
                 try:
                     import textract
                     return textract.process(self.file_path).decode('utf-8')
@@ -0,0 +1,301 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_INDEX_PATH = os.path.join('data', 'retention_index.db')
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_TOTAL_MB = 1024
+DEFAULT_SWEEP_INTERVAL = 15 * 60  # seconds
+
+# When over quota, evict down to this fraction of it so that eviction happens
+# in occasional bulk sweeps rather than on every new file.
+DEFAULT_LOW_WATER_RATIO = 0.9
+
+DELETE_BATCH_SIZE = 500
+
+
+class RetentionManager:
+    """Track uploaded files and cached artifacts and enforce age and size quotas.
+
+    Every tracked file is recorded in a small SQLite index with its size and
+    last-access time, so quotas are enforced with indexed queries instead of
+    walking the directories. A file counts as accessed when it is tracked,
+    i.e. when it is saved or re-saved (uploads are only read right after being
+    saved), so eviction removes the files least recently saved, in bulk.
+    """
+
+    def __init__(self,
+                 index_path: str = DEFAULT_INDEX_PATH,
+                 max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS,
+                 max_total_mb: Optional[float] = DEFAULT_MAX_TOTAL_MB,
+                 low_water_ratio: float = DEFAULT_LOW_WATER_RATIO):
+        """Initialize the manager and create the index if needed.
+
+        Args:
+            index_path: Path to the SQLite index file
+            max_age_days: Evict files not accessed for this many days (None to disable)
+            max_total_mb: Maximum total size of tracked files in MB (None to disable)
+            low_water_ratio: Fraction of the size quota to evict down to when it is exceeded
+        """
+        self.index_path = index_path
+        self.max_age_seconds = max_age_days * 86400 if max_age_days is not None else None
+        self.max_total_bytes = int(max_total_mb * 1024 * 1024) if max_total_mb is not None else None
+        self.low_water_ratio = low_water_ratio
+
+        self._sweep_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    category TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_files_last_access ON files (last_access)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction; one per operation keeps the manager thread-safe."""
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return str(Path(path).resolve())
+
+    def track(self, path: str, category: str = 'upload') -> None:
+        """Record (or refresh) a file in the index, marking it as just accessed."""
+        size = os.path.getsize(path)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, category, size, last_access) VALUES (?, ?, ?, ?)",
+                (self._key(path), category, size, time.time())
+            )
+
+    def untrack(self, path: str) -> None:
+        """Remove a file from the index without deleting it."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM files WHERE path = ?", (self._key(path),))
+
+    def usage(self) -> Dict[str, Any]:
+        """Return the number and total size of tracked files, per category and overall."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT category, COUNT(*), COALESCE(SUM(size), 0) FROM files GROUP BY category"
+            ).fetchall()
+        categories = {category: {'files': count, 'bytes': size} for category, count, size in rows}
+        return {
+            'files': sum(c['files'] for c in categories.values()),
+            'bytes': sum(c['bytes'] for c in categories.values()),
+            'categories': categories
+        }
+
+    def rebuild(self, directories: Iterable[str], category: str = 'upload') -> int:
+        """Index files already present in the given directories.
+
+        This is the only operation that walks the filesystem; run it once to
+        adopt files written before tracking was enabled. Files that are already
+        tracked keep their recorded last-access time.
+
+        Returns:
+            Number of files newly added to the index
+        """
+        rows = []
+        for directory in directories:
+            for root, _, files in os.walk(directory):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue
+                    rows.append((self._key(file_path), category, stat.st_size,
+                                 max(stat.st_atime, stat.st_mtime)))
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO files (path, category, size, last_access) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            return conn.total_changes - before
+
+    def _select_batch(self, where: str, params: tuple, skip: int) -> List[Tuple[str, int, float]]:
+        """Return the next batch of eviction candidates as ``(path, size, last_access)``, oldest first.
+
+        ``skip`` passes over files that could not be deleted earlier in the
+        sweep, since their rows stay at the front of the ordering.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT path, size, last_access FROM files {where} ORDER BY last_access, path LIMIT ? OFFSET ?",
+                params + (DELETE_BATCH_SIZE, skip)
+            ).fetchall()
+
+    def _evict(self, rows: List[Tuple[str, int, float]]) -> Tuple[List[Tuple[str, int]], int, int]:
+        """Delete files on disk and drop the index rows of those that are gone.
+
+        Each row is re-checked first: if the file was tracked again since the
+        batch was selected (e.g. the same name was re-uploaded), its
+        ``last_access`` has moved on and the new file is left alone. The check,
+        unlink and row delete for a batch happen in one short write
+        transaction, so ``track`` cannot refresh a row in between, and
+        concurrent ``track`` calls only wait for one batch rather than the
+        whole sweep.
+
+        Files that cannot be deleted (e.g. permission denied) stay in the index
+        so they keep counting towards the quota.
+
+        Returns:
+            The rows dropped from the index, the number of bytes actually freed
+            and the number of files that could not be deleted
+        """
+        dropped = []
+        freed_bytes = 0
+        failed = 0
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for path, size, last_access in rows:
+                current = conn.execute("SELECT last_access FROM files WHERE path = ?", (path,)).fetchone()
+                if current is None or current[0] != last_access:
+                    continue
+                try:
+                    os.unlink(path)
+                    freed_bytes += size
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Error removing {path}: {e}")
+                    failed += 1
+                    continue
+                conn.execute("DELETE FROM files WHERE path = ? AND last_access = ?", (path, last_access))
+                dropped.append((path, size))
+        return dropped, freed_bytes, failed
+
+    def sweep(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Evict expired files, then the least recently saved files until under quota.
+
+        Returns:
+            Dictionary with the number of ``expired`` and ``evicted`` entries
+            removed from the index and the ``freed_bytes`` actually deleted
+        """
+        now = time.time() if now is None else now
+        stats = {'expired': 0, 'evicted': 0, 'freed_bytes': 0}
+
+        if self.max_age_seconds is not None:
+            cutoff = now - self.max_age_seconds
+            failed = 0
+            while True:
+                rows = self._select_batch("WHERE last_access < ?", (cutoff,), failed)
+                if not rows:
+                    break
+                dropped, freed_bytes, batch_failed = self._evict(rows)
+                failed += batch_failed
+                stats['expired'] += len(dropped)
+                stats['freed_bytes'] += freed_bytes
+
+        if self.max_total_bytes is not None:
+            with self._connect() as conn:
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+            if total > self.max_total_bytes:
+                to_release = total - int(self.max_total_bytes * self.low_water_ratio)
+                failed = 0
+                while to_release > 0:
+                    rows = self._select_batch("", (), failed)
+                    if not rows:
+                        break
+                    victims = []
+                    planned = 0
+                    for path, size, last_access in rows:
+                        if planned >= to_release:
+                            break
+                        victims.append((path, size, last_access))
+                        planned += size
+                    dropped, freed_bytes, batch_failed = self._evict(victims)
+                    failed += batch_failed
+                    to_release -= sum(size for _, size in dropped)
+                    stats['evicted'] += len(dropped)
+                    stats['freed_bytes'] += freed_bytes
+
+        return stats
+
+    def start_background_sweep(self, interval: float = DEFAULT_SWEEP_INTERVAL) -> None:
+        """Run ``sweep`` every ``interval`` seconds in a daemon thread."""
+        if self._sweep_thread is not None and self._sweep_thread.is_alive():
+            return
+
+        def run():
+            while not self._stop_event.wait(interval):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    print(f"Error during retention sweep: {e}")
+
+        self._stop_event.clear()
+        self._sweep_thread = threading.Thread(target=run, daemon=True)
+        self._sweep_thread.start()
+
+    def stop_background_sweep(self) -> None:
+        """Stop the background sweep thread, if running."""
+        self._stop_event.set()
+        if self._sweep_thread is not None:
+            self._sweep_thread.join()
+            self._sweep_thread = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enforce retention quotas on uploads and cached artifacts.")
+    parser.add_argument('command', choices=['sweep', 'rebuild', 'usage', 'watch'],
+                        help="sweep once, index existing files, report usage, or sweep periodically")
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help="Index file (default: %(default)s)")
+    parser.add_argument('--max-age-days', type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help="Evict files not accessed for this many days (default: %(default)s)")
+    parser.add_argument('--max-total-mb', type=float, default=DEFAULT_MAX_TOTAL_MB,
+                        help="Total size quota in MB (default: %(default)s)")
+    parser.add_argument('--dirs', nargs='+', default=['uploads'],
+                        help="Directories to index for 'rebuild' (default: uploads)")
+    parser.add_argument('--category', default='upload', help="Category for 'rebuild' (default: %(default)s)")
+    parser.add_argument('--interval', type=float, default=DEFAULT_SWEEP_INTERVAL,
+                        help="Seconds between sweeps for 'watch' (default: %(default)s)")
+    args = parser.parse_args()
+
+    manager = RetentionManager(args.index, args.max_age_days, args.max_total_mb)
+
+    if args.command == 'rebuild':
+        added = manager.rebuild(args.dirs, args.category)
+        print(f"Indexed {added} new file(s)")
+    elif args.command == 'usage':
+        usage = manager.usage()
+        print(f"Tracked: {usage['files']} file(s), {usage['bytes'] / (1024 * 1024):.1f} MB")
+        for category, stats in sorted(usage['categories'].items()):
+            print(f"  - {category}: {stats['files']} file(s), {stats['bytes'] / (1024 * 1024):.1f} MB")
+    elif args.command == 'sweep':
+        stats = manager.sweep()
+        print(f"Expired {stats['expired']}, evicted {stats['evicted']}, "
+              f"freed {stats['freed_bytes'] / (1024 * 1024):.1f} MB")
+    else:
+        print(f"Sweeping every {args.interval:.0f}s, press Ctrl+C to stop")
+        manager.start_background_sweep(args.interval)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            manager.stop_background_sweep()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import argparse
+import base64
+import io
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+from src.resume_parser import ResumeParser, detect_file_type
+from src.resume_matcher import ResumeMatcher
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+
+MAX_BODY_SIZE = 20 * 1024 * 1024  # 20 MB
+
+
+class MatchBatcher:
+    """Collect concurrent match requests and score them in vectorized batches.
+
+    A single background thread owns the ResumeMatcher, so requests for the
+    same job description that arrive within ``max_wait_ms`` of each other are
+    scored with one ``match_resumes_to_job`` call. This also serializes access
+    to the matcher, whose TF-IDF vectorizer is not safe to share across threads.
+    """
+
+    def __init__(self, matcher: ResumeMatcher,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+        """Initialize the batcher and start its scoring thread.
+
+        Args:
+            matcher: Preloaded ResumeMatcher used for all scoring
+            max_batch_size: Maximum number of resumes scored per batch
+            max_wait_ms: How long to wait for more requests after the first one
+        """
+        self.matcher = matcher
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, resume_text: str, job_description: str) -> Future:
+        """Queue a resume for scoring and return a future for its match result."""
+        future: Future = Future()
+        self._pending.put((job_description, resume_text, future))
+        return future
+
+    def match(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+        """Score a single resume, blocking until its batch has been processed."""
+        return self.submit(resume_text, job_description).result()
+
+    def match_many(self, resume_texts: List[str], job_description: str) -> List[Dict[str, Any]]:
+        """Score several resumes against one job description, in input order."""
+        futures = [self.submit(text, job_description) for text in resume_texts]
+        return [future.result() for future in futures]
+
+    def _collect(self) -> List[Tuple[str, str, Future]]:
+        """Block for the first request, then gather more until full or timed out."""
+        batch = [self._pending.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Scoring loop: group each collected batch by job description and score it."""
+        while True:
+            groups: Dict[str, List[Tuple[str, Future]]] = {}
+            for job_description, resume_text, future in self._collect():
+                groups.setdefault(job_description, []).append((resume_text, future))
+
+            for job_description, items in groups.items():
+                try:
+                    results = self.matcher.match_resumes_to_job(
+                        [text for text, _ in items], job_description
+                    )
+                except Exception as e:
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints for parsing, matching and ranking resumes.
+
+    POST /parse  {"file_name": str, "content": base64 str}
+    POST /match  {"resume_text": str, "job_description": str}
+    POST /rank   {"job_description": str, "resumes": [{"file_name": str, "text": str}]}
+    GET  /health
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        """Silence per-request logging; it dominates latency under load."""
+        pass
+
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload).encode('utf-8')
+        # After an error the request body may be unread, so never reuse the
+        # connection: leftover bytes would be parsed as the next request.
+        if status >= 400:
+            self.close_connection = True
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length < 0:
+            raise ValueError("Content-Length must not be negative")
+        if length > MAX_BODY_SIZE:
+            raise ValueError(f"Request body exceeds limit of {MAX_BODY_SIZE} bytes")
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        return payload
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'pid': os.getpid()})
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        routes = {
+            '/parse': self._handle_parse,
+            '/match': self._handle_match,
+            '/rank': self._handle_rank,
+        }
+        handler = routes.get(self.path)
+        if handler is None:
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+
+        try:
+            payload = self._read_json()
+            self._send_json(200, handler(payload))
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {'error': f"Invalid request: {str(e)}"})
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+    def _handle_parse(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        content = base64.b64decode(payload['content'], validate=True)
+        parser = ResumeParser(payload['file_name'], stream=io.BytesIO(content),
+                              file_type=detect_file_type(content[:4]))
+        try:
+            return parser.parse()
+        except Exception as e:
+            # The parser wraps every failure in a bare Exception; an unreadable
+            # upload is a client error, not a server fault
+            raise ValueError(str(e)) from e
+
+    def _handle_match(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self.server.batcher.match(str(payload['resume_text']), str(payload['job_description']))
+
+    def _handle_rank(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        resumes = payload['resumes']
+        matches = self.server.batcher.match_many(
+            [str(resume['text']) for resume in resumes], str(payload['job_description'])
+        )
+        results = [dict(match, file_name=resume.get('file_name', f"resume_{i + 1}"))
+                   for i, (resume, match) in enumerate(zip(resumes, matches))]
+        results.sort(key=lambda x: x['score'], reverse=True)
+        return {'results': results}
+
+
+def create_server(sock: socket.socket, matcher: ResumeMatcher,
+                  max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                  max_wait_ms: float = DEFAULT_MAX_WAIT_MS) -> ThreadingHTTPServer:
+    """Build an HTTP server on an already listening socket around a loaded matcher."""
+    server = ThreadingHTTPServer(sock.getsockname()[:2], ScoringRequestHandler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = sock
+    server.daemon_threads = True
+    server.batcher = MatchBatcher(matcher, max_batch_size, max_wait_ms)
+    return server
+
+
+def _worker_main(sock: socket.socket, max_batch_size: int, max_wait_ms: float):
+    """Worker process entry point: preload the models once, then serve forever."""
+    matcher = ResumeMatcher()
+    # Warm up lazily loaded resources (e.g. WordNet) before taking traffic
+    matcher.match_resumes_to_job(["warm up"], "warm up")
+
+    server = create_server(sock, matcher, max_batch_size, max_wait_ms)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1,
+          max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+    """Run the scoring service with ``workers`` processes sharing one listening socket.
+
+    Args:
+        host: Interface to bind (defaults to localhost only)
+        port: TCP port to listen on
+        workers: Number of worker processes, each with its own preloaded models
+        max_batch_size: Maximum number of resumes scored per batch in a worker
+        max_wait_ms: Micro-batching window in milliseconds
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(128)
+
+    processes = [
+        multiprocessing.Process(target=_worker_main, args=(sock, max_batch_size, max_wait_ms), daemon=True)
+        for _ in range(max(1, workers))
+    ]
+    for process in processes:
+        process.start()
+
+    print(f"Scoring service listening on http://{host}:{port} with {len(processes)} worker(s)")
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+    finally:
+        sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP service for parsing, matching and ranking resumes.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to bind (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port to listen on (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="Maximum resumes per scoring batch (default: %(default)s)")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="Micro-batching window in milliseconds (default: %(default)s)")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.workers, args.max_batch_size, args.max_wait_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the ``src`` package importable the same way app.py does
+sys.path.insert(0, str(Path(__file__).parent.parent))
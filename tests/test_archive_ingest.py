@@ -0,0 +1,142 @@
+import io
+import struct
+import zipfile
+
+import pytest
+from docx import Document
+
+from src.archive_ingest import ArchiveIngestor
+
+
+def make_docx(text: str) -> bytes:
+    doc = Document()
+    doc.add_paragraph(text)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def make_zip(members, compression=zipfile.ZIP_DEFLATED) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def under_declare_size(archive: io.BytesIO, declared: int) -> io.BytesIO:
+    """Rewrite every local and central header to claim ``declared`` uncompressed bytes."""
+    data = bytearray(archive.getvalue())
+    for signature, offset in [(b'PK\x03\x04', 22), (b'PK\x01\x02', 24)]:
+        start = data.find(signature)
+        while start != -1:
+            struct.pack_into('<I', data, start + offset, declared)
+            start = data.find(signature, start + 4)
+    return io.BytesIO(bytes(data))
+
+
+def collect(ingestor, archive):
+    return [(name, stream is not None, file_type, error)
+            for name, stream, file_type, error in ingestor.iter_members(archive)]
+
+
+def test_skips_non_resume_members():
+    archive = make_zip([
+        ('resume.pdf', b'%PDF-1.4 fake'),
+        ('notes.txt', b'hello'),
+        ('nested.zip', make_zip([('a.txt', b'a')]).getvalue()),
+        ('sheet.xlsx', b'PK\x03\x04 not a resume'),
+        ('__MACOSX/._resume.pdf', b'%PDF'),
+        ('folder/', b''),
+    ])
+    assert collect(ArchiveIngestor(), archive) == [('resume.pdf', True, 'pdf', None)]
+
+
+def test_sniffed_type_overrides_extension():
+    archive = make_zip([('misnamed.docx', b'%PDF-1.4 fake'), ('cv.docx', make_docx("Python"))])
+    assert [(name, file_type) for name, _, file_type, _ in ArchiveIngestor().iter_members(archive)] == [
+        ('misnamed.docx', 'pdf'), ('cv.docx', 'docx')
+    ]
+
+
+def test_per_member_limit_reports_error_and_continues():
+    archive = make_zip([('big.pdf', b'%PDF' + b'0' * 5000), ('small.pdf', b'%PDF')])
+    results = collect(ArchiveIngestor(max_member_size=1000), archive)
+    assert results[0][:2] == ('big.pdf', False)
+    assert 'per-file size limit' in results[0][3]
+    assert results[1] == ('small.pdf', True, 'pdf', None)
+
+
+def test_under_declared_size_is_not_trusted():
+    archive = under_declare_size(make_zip([('bomb.pdf', b'%PDF' + b'0' * 100000)]), 10)
+    results = collect(ArchiveIngestor(max_member_size=1000), archive)
+    assert len(results) == 1
+    name, has_stream, _, error = results[0]
+    assert name == 'bomb.pdf' and not has_stream and error
+
+
+def test_corrupt_member_does_not_abort_archive():
+    archive = make_zip([('bad.pdf', b'%PDF' + b'x' * 100), ('good.pdf', b'%PDF')], zipfile.ZIP_STORED)
+    data = bytearray(archive.getvalue())
+    data[data.find(b'x' * 100) + 50] ^= 0xFF
+    results = collect(ArchiveIngestor(), io.BytesIO(bytes(data)))
+    assert results[0][0] == 'bad.pdf' and 'CRC' in results[0][3]
+    assert results[1] == ('good.pdf', True, 'pdf', None)
+
+
+@pytest.mark.parametrize('compression', [zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA])
+def test_corrupt_compressed_member_does_not_abort_archive(compression):
+    payload = b'%PDF' + bytes(range(256)) * 40
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as out:
+        out.writestr('bad.pdf', payload, compress_type=compression)
+        out.writestr('good.pdf', b'%PDF', compress_type=zipfile.ZIP_STORED)
+    data = bytearray(archive.getvalue())
+    # Flip bytes in the middle of the first member's compressed data
+    info = zipfile.ZipFile(io.BytesIO(bytes(data))).getinfo('bad.pdf')
+    data_start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+    middle = data_start + info.compress_size // 2
+    for offset in range(middle - 8, middle + 8):
+        data[offset] ^= 0xFF
+    results = collect(ArchiveIngestor(), io.BytesIO(bytes(data)))
+    assert results[0][:3] == ('bad.pdf', False, None) and results[0][3].startswith('Error reading bad.pdf')
+    assert results[1] == ('good.pdf', True, 'pdf', None)
+
+
+def test_ole_members_are_reported_or_skipped():
+    ole = b'\xD0\xCF\x11\xE0' + b'\x00' * 100
+    archive = make_zip([('old.doc', ole), ('sheet.xls', ole), ('mail.msg', ole), ('cv.pdf', b'%PDF')])
+    results = collect(ArchiveIngestor(), archive)
+    assert [(name, has_stream) for name, has_stream, _, _ in results] == [('old.doc', False), ('cv.pdf', True)]
+    assert 'not supported' in results[0][3]
+
+
+def test_total_limit_keeps_resumes_parsed_so_far():
+    archive = make_zip([
+        ('a.docx', make_docx("Alice")),
+        ('b.pdf', b'%PDF' + b'0' * 100000),
+        ('c.docx', make_docx("Carol")),
+    ])
+    first_size = len(make_docx("Alice"))
+    result = ArchiveIngestor(max_total_size=first_size + 1000).ingest(archive)
+    assert [r['file_name'] for r in result['resumes']] == ['a.docx']
+    assert 'Alice' in result['resumes'][0]['clean_text']
+    assert len(result['errors']) == 1
+    assert 'total size limit' in result['errors'][0]['error']
+
+
+def test_member_count_limit():
+    archive = make_zip([(f"{i}.pdf", b'%PDF') for i in range(5)])
+    results = collect(ArchiveIngestor(max_members=3), archive)
+    assert [r[1] for r in results] == [True, True, True, False]
+    assert 'member limit' in results[-1][3]
+
+
+def test_ingest_reports_errors_and_throughput():
+    archive = make_zip([('cv.docx', make_docx("Python developer")), ('broken.pdf', b'%PDF garbage')])
+    result = ArchiveIngestor().ingest(archive)
+    assert [r['file_name'] for r in result['resumes']] == ['cv.docx']
+    assert [e['file_name'] for e in result['errors']] == ['broken.pdf']
+    assert result['stats']['files'] == 1
+    assert result['stats']['files_per_sec'] > 0
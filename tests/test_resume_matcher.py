@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from src import resume_matcher
+from src.resume_matcher import ResumeMatcher
+
+WORDS = ("python java sql docker kubernetes aws machine learning data team lead "
+         "senior api rest go rust the and of with").split()
+
+
+class FakeStopwords:
+    @staticmethod
+    def words(language):
+        return ['the', 'and', 'of', 'with']
+
+
+class FakeLemmatizer:
+    def lemmatize(self, token):
+        return token
+
+
+@pytest.fixture
+def matcher(monkeypatch):
+    """A real ResumeMatcher with the spaCy model and NLTK corpora stubbed out."""
+    monkeypatch.setattr(resume_matcher.spacy, 'load', lambda name: None)
+    monkeypatch.setattr(resume_matcher, 'stopwords', FakeStopwords)
+    monkeypatch.setattr(resume_matcher, 'word_tokenize', str.split)
+    monkeypatch.setattr(resume_matcher, 'WordNetLemmatizer', FakeLemmatizer)
+    return ResumeMatcher()
+
+
+def random_texts(seed, count=60):
+    rng = random.Random(seed)
+    texts = [" ".join(rng.choices(WORDS, k=rng.randint(0, 40))) for _ in range(count)]
+    return texts + ["", "the and of"], " ".join(rng.choices(WORDS, k=30))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_calculate_similarities_matches_pairwise(matcher, seed):
+    texts, job = random_texts(seed)
+    batch = matcher.calculate_similarities(texts, job)
+    pairwise = [matcher.calculate_similarity(text, job) for text in texts]
+    assert batch == pytest.approx(pairwise, abs=1e-12)
+
+
+@pytest.mark.parametrize('settings', [
+    {'sublinear_tf': True, 'ngram_range': (1, 1)},
+    {'max_features': 5},
+    {'min_df': 2},
+    {'max_df': 0.5},
+    {'vocabulary': ['python', 'java', 'sql', 'docker']},
+])
+def test_calculate_similarities_follows_vectorizer_settings(matcher, settings):
+    matcher.vectorizer.set_params(**settings)
+    texts, job = random_texts(42)
+    batch = matcher.calculate_similarities(texts, job)
+    pairwise = [matcher.calculate_similarity(text, job) for text in texts]
+    assert batch == pytest.approx(pairwise, abs=1e-12)
+
+
+def test_match_resume_to_job_uses_batch_scoring(matcher):
+    texts, job = random_texts(7, count=10)
+    batch = matcher.match_resumes_to_job(texts, job)
+    assert [matcher.match_resume_to_job(text, job) for text in texts] == batch
+    assert all(0 <= result['score'] <= 100 for result in batch)
@@ -0,0 +1,165 @@
+import os
+import time
+
+import pytest
+
+from src import retention
+from src.retention import RetentionManager
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def uploads(tmp_path):
+    directory = tmp_path / 'uploads'
+    directory.mkdir()
+    return directory
+
+
+def make_manager(tmp_path, **kwargs):
+    return RetentionManager(str(tmp_path / 'data' / 'retention_index.db'), **kwargs)
+
+
+def write(directory, name, size):
+    path = directory / name
+    path.write_bytes(b'x' * size)
+    return str(path)
+
+
+def set_last_access(manager, path, last_access):
+    with manager._connect() as conn:
+        conn.execute("UPDATE files SET last_access = ? WHERE path = ?", (last_access, manager._key(path)))
+
+
+def test_sweep_expires_old_files(tmp_path, uploads):
+    manager = make_manager(tmp_path, max_age_days=1, max_total_mb=None)
+    old = write(uploads, 'old.pdf', 100)
+    new = write(uploads, 'new.pdf', 200)
+    manager.track(old)
+    manager.track(new)
+    set_last_access(manager, old, time.time() - 2 * 86400)
+
+    assert manager.sweep() == {'expired': 1, 'evicted': 0, 'freed_bytes': 100}
+    assert not os.path.exists(old) and os.path.exists(new)
+    assert manager.usage()['files'] == 1
+
+
+def test_sweep_evicts_least_recent_down_to_low_water(tmp_path, uploads):
+    manager = make_manager(tmp_path, max_age_days=None, max_total_mb=1, low_water_ratio=0.5)
+    paths = [write(uploads, f"{i}.pdf", MB // 4) for i in range(6)]
+    for i, path in enumerate(paths):
+        manager.track(path)
+        set_last_access(manager, path, 1000 + i)
+    # The oldest file was saved again most recently, so it survives
+    set_last_access(manager, paths[0], 2000)
+
+    stats = manager.sweep()
+
+    # 1.5 MB tracked, 1 MB quota, evict down to 0.5 MB: four files go
+    assert stats == {'expired': 0, 'evicted': 4, 'freed_bytes': MB}
+    assert [os.path.exists(path) for path in paths] == [True, False, False, False, False, True]
+    assert manager.usage()['bytes'] == MB // 2
+
+
+def test_sweep_under_quota_is_noop(tmp_path, uploads):
+    manager = make_manager(tmp_path, max_age_days=None, max_total_mb=1)
+    manager.track(write(uploads, 'a.pdf', 1000))
+    assert manager.sweep() == {'expired': 0, 'evicted': 0, 'freed_bytes': 0}
+
+
+def test_rebuild_keeps_existing_last_access(tmp_path, uploads):
+    manager = make_manager(tmp_path)
+    tracked = write(uploads, 'tracked.pdf', 10)
+    manager.track(tracked)
+    set_last_access(manager, tracked, 12345)
+    write(uploads, 'untracked.pdf', 20)
+
+    assert manager.rebuild([str(uploads)]) == 1
+    with manager._connect() as conn:
+        rows = dict(conn.execute("SELECT path, last_access FROM files"))
+    assert rows[manager._key(tracked)] == 12345
+    assert manager.usage() == {'files': 2, 'bytes': 30, 'categories': {'upload': {'files': 2, 'bytes': 30}}}
+
+
+def test_failed_unlink_stays_tracked(tmp_path, uploads, monkeypatch):
+    manager = make_manager(tmp_path, max_age_days=1, max_total_mb=None)
+    locked = write(uploads, 'locked.pdf', 100)
+    other = write(uploads, 'other.pdf', 200)
+    for path in (locked, other):
+        manager.track(path)
+        set_last_access(manager, path, 0)
+
+    real_unlink = os.unlink
+
+    def unlink(path):
+        if path == manager._key(locked):
+            raise PermissionError(13, 'Permission denied', path)
+        real_unlink(path)
+
+    monkeypatch.setattr(retention.os, 'unlink', unlink)
+    # Small batches make the sweep page past the undeletable file
+    monkeypatch.setattr(retention, 'DELETE_BATCH_SIZE', 1)
+
+    assert manager.sweep() == {'expired': 1, 'evicted': 0, 'freed_bytes': 200}
+    assert os.path.exists(locked) and not os.path.exists(other)
+    assert manager.usage()['bytes'] == 100
+
+
+def test_failed_unlink_does_not_count_towards_quota_eviction(tmp_path, uploads, monkeypatch):
+    manager = make_manager(tmp_path, max_age_days=None, max_total_mb=1, low_water_ratio=0.5)
+    paths = [write(uploads, f"{i}.pdf", MB // 4) for i in range(6)]
+    for i, path in enumerate(paths):
+        manager.track(path)
+        set_last_access(manager, path, 1000 + i)
+
+    real_unlink = os.unlink
+
+    def unlink(path):
+        if path == manager._key(paths[0]):
+            raise PermissionError(13, 'Permission denied', path)
+        real_unlink(path)
+
+    monkeypatch.setattr(retention.os, 'unlink', unlink)
+    # Small batches make the sweep page past the undeletable file
+    monkeypatch.setattr(retention, 'DELETE_BATCH_SIZE', 1)
+
+    stats = manager.sweep()
+
+    # The undeletable file still counts, so one more file has to go instead
+    assert stats == {'expired': 0, 'evicted': 4, 'freed_bytes': MB}
+    assert [os.path.exists(path) for path in paths] == [True, False, False, False, False, True]
+    assert manager.usage()['bytes'] == MB // 2
+
+
+def test_missing_files_are_dropped_without_counting_bytes(tmp_path, uploads):
+    manager = make_manager(tmp_path, max_age_days=1, max_total_mb=None)
+    gone = write(uploads, 'gone.pdf', 100)
+    manager.track(gone)
+    set_last_access(manager, gone, 0)
+    os.unlink(gone)
+
+    assert manager.sweep() == {'expired': 1, 'evicted': 0, 'freed_bytes': 0}
+    assert manager.usage()['files'] == 0
+
+
+def test_reuploaded_file_is_not_evicted_mid_sweep(tmp_path, uploads, monkeypatch):
+    manager = make_manager(tmp_path, max_age_days=1, max_total_mb=None)
+    path = write(uploads, 'cv.pdf', 100)
+    manager.track(path)
+    set_last_access(manager, path, 0)
+
+    select_batch = manager._select_batch
+
+    def select_then_reupload(*args):
+        rows = select_batch(*args)
+        if rows:
+            # The same name is uploaded again after the sweep picked it
+            write(uploads, 'cv.pdf', 150)
+            manager.track(path)
+        return rows
+
+    monkeypatch.setattr(manager, '_select_batch', select_then_reupload)
+
+    assert manager.sweep() == {'expired': 0, 'evicted': 0, 'freed_bytes': 0}
+    assert os.path.getsize(path) == 150
+    assert manager.usage()['bytes'] == 150
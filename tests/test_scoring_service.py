@@ -0,0 +1,157 @@
+import base64
+import http.client
+import io
+import json
+import socket
+import threading
+
+import pytest
+from docx import Document
+
+from src.scoring_service import create_server
+
+
+class StubMatcher:
+    """Scores a resume by its length and records every batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def match_resumes_to_job(self, resume_texts, job_description):
+        self.batches.append((job_description, list(resume_texts)))
+        return [{'score': float(len(text)), 'matched_keywords': [], 'total_keywords': 0}
+                for text in resume_texts]
+
+
+@pytest.fixture
+def service():
+    """Serve on an ephemeral localhost port; yields (port, matcher)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(32)
+    matcher = StubMatcher()
+    server = create_server(sock, matcher, max_batch_size=64, max_wait_ms=200)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield sock.getsockname()[1], matcher
+    server.shutdown()
+    server.server_close()
+
+
+def request(port, method, path, payload=None, body=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    if payload is not None:
+        body = json.dumps(payload)
+    conn.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    result = response.status, json.loads(response.read())
+    conn.close()
+    return result
+
+
+def raw_exchange(port, data: bytes) -> bytes:
+    """Send raw bytes and read until the server closes the connection."""
+    with socket.create_connection(('127.0.0.1', port), timeout=10) as conn:
+        conn.sendall(data)
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def test_health(service):
+    port, _ = service
+    status, body = request(port, 'GET', '/health')
+    assert status == 200 and body['status'] == 'ok'
+
+
+def test_match(service):
+    port, matcher = service
+    status, body = request(port, 'POST', '/match', {'resume_text': 'python', 'job_description': 'jd'})
+    assert status == 200 and body['score'] == 6.0
+    assert matcher.batches == [('jd', ['python'])]
+
+
+def test_rank_sorts_by_score(service):
+    port, _ = service
+    status, body = request(port, 'POST', '/rank', {
+        'job_description': 'jd',
+        'resumes': [{'file_name': 'short', 'text': 'a'}, {'file_name': 'long', 'text': 'abcdef'}, {'text': 'abc'}]
+    })
+    assert status == 200
+    assert [r['file_name'] for r in body['results']] == ['long', 'resume_3', 'short']
+
+
+def test_parse(service):
+    port, _ = service
+    doc = Document()
+    doc.add_paragraph("Senior Python developer")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    status, body = request(port, 'POST', '/parse', {
+        'file_name': 'cv.bin', 'content': base64.b64encode(buffer.getvalue()).decode()
+    })
+    assert status == 200
+    assert body['file_type'] == 'docx' and 'Senior Python developer' in body['clean_text']
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/match', json.dumps({'resume_text': 'no job description'})),
+    ('/match', 'not json'),
+    ('/match', json.dumps(['not', 'an', 'object'])),
+    ('/parse', json.dumps({'file_name': 'cv.pdf', 'content': '***'})),
+    ('/parse', json.dumps({'file_name': 'notes.txt', 'content': base64.b64encode(b'hello').decode()})),
+    ('/parse', json.dumps({'file_name': 'cv.pdf',
+                           'content': base64.b64encode(b'%PDF-1.4 corrupt \x00\xff garbage').decode()})),
+])
+def test_invalid_requests_return_400(service, path, body):
+    port, _ = service
+    status, response = request(port, 'POST', path, body=body)
+    assert status == 400 and 'error' in response
+
+
+def test_unknown_endpoint_returns_404(service):
+    port, _ = service
+    assert request(port, 'POST', '/nope', {})[0] == 404
+
+
+def test_oversized_body_closes_connection(service):
+    port, _ = service
+    smuggled = b'GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n'
+    response = raw_exchange(port, (
+        b'POST /match HTTP/1.1\r\nHost: localhost\r\nContent-Length: 99999999\r\n\r\n' + smuggled
+    ))
+    assert response.startswith(b'HTTP/1.1 400')
+    assert response.count(b'HTTP/1.1 ') == 1
+
+
+def test_negative_content_length_is_rejected(service):
+    port, _ = service
+    response = raw_exchange(port, b'POST /match HTTP/1.1\r\nHost: localhost\r\nContent-Length: -1\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 400')
+
+
+def test_concurrent_same_job_requests_are_batched(service):
+    port, matcher = service
+    clients = 8
+    barrier = threading.Barrier(clients)
+    statuses = []
+
+    def send(i):
+        barrier.wait()
+        statuses.append(request(port, 'POST', '/match', {'resume_text': 'x' * i, 'job_description': 'shared'})[0])
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * clients
+    batch_sizes = [len(texts) for job, texts in matcher.batches]
+    assert sum(batch_sizes) == clients
+    assert max(batch_sizes) > 1
+    assert all(job == 'shared' for job, _ in matcher.batches)